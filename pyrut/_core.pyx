@@ -0,0 +1,44 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Núcleo compilado (Cython) del algoritmo módulo 11 para PyRUT.
+
+Esta extensión es opcional: si no está compilada, core.py usa las
+implementaciones en Python puro. El cálculo libera el GIL, por lo que
+puede ejecutarse en paralelo desde múltiples hilos.
+"""
+
+
+cpdef int mod11_c(bytes buf):
+    """Calcula 11 - (suma % 11) para un número dado como bytes ASCII.
+
+    Retorna un valor en 1..11; el mapeo 11 -> '0' y 10 -> 'K' queda en
+    manos del llamador (core._algoritmo_modulo11).
+    """
+    cdef const unsigned char* s = buf
+    cdef Py_ssize_t n = len(buf)
+    cdef Py_ssize_t i
+    cdef unsigned long suma = 0
+    cdef int peso = 2
+
+    with nogil:
+        for i in range(n - 1, -1, -1):
+            suma += <unsigned long>(s[i] - 48) * peso
+            peso = 2 if peso == 7 else peso + 1
+
+    return 11 - <int>(suma % 11)
+
+
+cpdef int mod11_int_c(unsigned long long n) nogil:
+    """Variante de mod11_c que opera sobre el número entero directo.
+
+    Extrae los dígitos con divisiones sucesivas, sin buffer intermedio.
+    Retorna 11 - (suma % 11), en 1..11, igual que mod11_c.
+    """
+    cdef unsigned long long total = 0
+    cdef int peso = 2
+
+    while n > 0:
+        total += (n % 10) * peso
+        n //= 10
+        peso = 2 if peso == 7 else peso + 1
+
+    return 11 - <int>(total % 11)
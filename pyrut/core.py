@@ -10,9 +10,430 @@ Ejemplo de uso:
     True
 """
 
-import re
+from functools import lru_cache
 from typing import Optional
 
+# NumPy es una dependencia opcional: solo se necesita para las rutas de
+# validación por lotes (validar_lista_np). La librería sigue funcionando
+# sin ella.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Numba también es opcional: si está disponible, el núcleo del algoritmo
+# módulo 11 se compila a código nativo (JIT) en el primer uso.
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+# Extensión Cython opcional (pyrut/_core.pyx): si el paquete fue
+# instalado con la extensión compilada, el núcleo módulo 11 corre en C.
+try:
+    from ._core import mod11_c as _mod11_c, mod11_int_c as _mod11_int_c
+except ImportError:
+    _mod11_c = None
+    _mod11_int_c = None
+
+# Tabla de traducción para limpiar RUTs en una sola pasada a nivel C:
+# elimina separadores y normaliza 'k' minúscula, sin pasar por el motor
+# de expresiones regulares. Se construye una única vez al importar el
+# módulo; ninguna función del camino caliente construye tablas ni
+# compila patrones por llamada. Alternativas medidas y descartadas:
+# tabla de solo-borrado + .upper() (dos pasadas) y ''.join con filtro
+# por carácter, ambas más lentas que esta pasada única.
+# Blancos latin-1 que el motor de regex trataba como \s (y que
+# str.strip también elimina): cubrirlos todos mantiene la equivalencia
+# con la limpieza original basada en regex.
+_BLANCOS_LATIN1 = ' \t\n\v\f\r\x1c\x1d\x1e\x1f\x85\u00a0'
+
+_TRANS_TABLE = str.maketrans({
+    '.': None,
+    '-': None,
+    'k': 'K',
+    # el \u00a0 (espacio no separable) es frecuente en datos pegados desde web
+    **{blanco: None for blanco in _BLANCOS_LATIN1},
+})
+
+# Mapa de bits de 256 entradas (un byte por código latin-1) con los
+# caracteres plausibles en un RUT: dígitos, 'K'/'k' y los separadores
+# que _TRANS_TABLE elimina. Se materializa también como el conjunto de
+# bytes permitidos, para que el descarte de entradas basura sea una
+# única pasada C con bytes.translate en lugar de un chequeo por carácter
+# en Python.
+_PERMITIDOS_BITMAP = bytes(
+    1 if chr(codigo) in '0123456789Kk.-' + _BLANCOS_LATIN1 else 0
+    for codigo in range(256)
+)
+_BYTES_PERMITIDOS = bytes(
+    codigo for codigo in range(256) if _PERMITIDOS_BITMAP[codigo]
+)
+
+# Rango aproximado de RUTs válidos en Chile, a nivel de módulo para que
+# los caminos calientes los alcancen con LOAD_GLOBAL en lugar del lookup
+# de atributo en el diccionario de la clase. ValidadorRUT.RUT_MINIMO y
+# RUT_MAXIMO siguen siendo la API pública y referencian estos valores.
+_RUT_MINIMO = 1_000_000
+_RUT_MAXIMO = 99_999_999
+
+# Dígitos verificadores válidos (tras normalizar, 'k' ya es 'K');
+# frozenset para que la pertenencia sea un sondeo de hash O(1) en lugar
+# de un escaneo lineal del string
+_DV_VALIDOS = frozenset('0123456789K')
+
+# Tabla de mapeo del valor 11 - (suma % 11) al carácter del dígito
+# verificador: 11 -> '0', 10 -> 'K', el resto a su dígito. El índice 0
+# no se usa (el valor siempre está en 1..11).
+_DV_LOOKUP = ('?', '1', '2', '3', '4', '5', '6', '7', '8', '9', 'K', '0')
+
+# Tabla equivalente indexada directamente por (suma % 11): ahorra la
+# resta 11 - resto en los caminos que ya tienen la suma a mano.
+# Derivación: resto 0 -> dv 11 -> '0'; resto 1 -> dv 10 -> 'K'; resto m
+# -> str(11 - m) para el resto.
+_DV_CHARS = ('0', 'K', '9', '8', '7', '6', '5', '4', '3', '2', '1')
+
+# Serie cíclica base del módulo 11
+_CICLO = (2, 3, 4, 5, 6, 7)
+
+# Multiplicadores indexados por largo del número, ya alineados de
+# izquierda a derecha: permiten consumir los dígitos en orden de lectura
+# con un solo zip, sin invertir el string ni calcular `i % 6`.
+_WEIGHTS_BY_LEN = {
+    n: tuple(_CICLO[i % 6] for i in range(n))[::-1]
+    for n in range(1, 13)
+}
+
+# Constantes SWAR: hasta 8 dígitos ASCII caben en 64 bits (un byte por
+# dígito), lo que permite restar el '0' de todos los dígitos con una
+# sola operación entera.
+_SWAR_ASCII_CEROS = 0x3030303030303030
+_SWAR_SHIFTS_PESOS = tuple(
+    (shift, _CICLO[i % 6]) for i, shift in enumerate(range(0, 64, 8))
+)
+
+
+# Generador aleatorio de NumPy, creado de forma perezosa la primera vez
+# que se necesita (la API Generator es más rápida que np.random legado)
+_np_rng = None
+
+
+def _obtener_np_rng():
+    """Retorna el generador aleatorio de NumPy compartido, creándolo si hace falta."""
+    global _np_rng
+    if _np_rng is None:
+        _np_rng = _np.random.default_rng()
+    return _np_rng
+
+
+def _es_entrada_plausible(rut: str) -> bool:
+    """Descarta rápido entradas con caracteres imposibles en un RUT.
+
+    Recorta primero los blancos de los extremos (strip elimina también
+    espacios Unicode fuera de latin-1, igual que la limpieza completa),
+    codifica el resto a latin-1 (un byte por carácter) y borra de una
+    sola pasada C todos los bytes permitidos según _PERMITIDOS_BITMAP:
+    si queda algo, había un carácter ajeno al alfabeto de un RUT. Los
+    caracteres interiores fuera del rango 0-255 no pueden codificarse y
+    también descartan la entrada.
+
+    Args:
+        rut: El string a examinar, sin limpiar.
+
+    Returns:
+        True si todos los caracteres son plausibles, False si hay basura.
+    """
+    try:
+        return not rut.strip().encode('latin-1').translate(None, _BYTES_PERMITIDOS)
+    except UnicodeEncodeError:
+        return False
+
+
+def _mod11_swar(numero_bytes: bytes) -> int:
+    """Calcula la suma del módulo 11 al estilo SWAR (SIMD within a register).
+
+    Empaqueta hasta 8 dígitos ASCII en un entero de 64 bits, convierte
+    todos los dígitos a su valor numérico con una sola resta y acumula
+    los productos extrayendo cada byte por desplazamiento. El relleno
+    con '0' a la izquierda no aporta a la suma.
+
+    Args:
+        numero_bytes: El número base como bytes ASCII (máximo 8 dígitos).
+
+    Returns:
+        El resto de la suma ponderada dividida por 11.
+    """
+    if len(numero_bytes) != 8:
+        # Solo los números cortos pagan la copia del relleno
+        numero_bytes = numero_bytes.rjust(8, b'0')
+    d = int.from_bytes(numero_bytes, 'big') - _SWAR_ASCII_CEROS
+    suma = 0
+    for shift, peso in _SWAR_SHIFTS_PESOS:
+        suma += ((d >> shift) & 0xFF) * peso
+    return suma % 11
+
+
+def _dv_unrolled(n: int) -> str:
+    """Calcula el dígito verificador de un int con el bucle desenrollado.
+
+    Versión en línea recta para números de hasta 10 dígitos: sin range,
+    sin ciclo de pesos y con salida temprana cuando el número se agota.
+    Camino de respaldo de _dv_int cuando no hay núcleo compilado.
+
+    Args:
+        n: El número base del RUT como entero positivo (máximo 10 dígitos).
+
+    Returns:
+        El dígito verificador calculado ('0'-'9' o 'K').
+    """
+    total = (n % 10) * 2
+    n //= 10
+    if n:
+        total += (n % 10) * 3
+        n //= 10
+        if n:
+            total += (n % 10) * 4
+            n //= 10
+            if n:
+                total += (n % 10) * 5
+                n //= 10
+                if n:
+                    total += (n % 10) * 6
+                    n //= 10
+                    if n:
+                        total += (n % 10) * 7
+                        n //= 10
+                        if n:
+                            total += (n % 10) * 2
+                            n //= 10
+                            if n:
+                                total += (n % 10) * 3
+                                n //= 10
+                                if n:
+                                    total += (n % 10) * 4
+                                    n //= 10
+                                    if n:
+                                        total += (n % 10) * 5
+    return _DV_CHARS[total % 11]
+
+
+@lru_cache(maxsize=65536)
+def _dv_str_cached(numero_str: str) -> str:
+    """Versión memoizada del cálculo del dígito verificador.
+
+    En cargas reales (revalidación de formularios, lotes con RUTs
+    repetidos) el mismo número se valida muchas veces; la caché evita
+    repetir el cálculo completo. Solo se cachean entradas ya validadas.
+
+    Args:
+        numero_str: El número base del RUT como string de dígitos.
+
+    Returns:
+        El dígito verificador calculado ('0'-'9' o 'K').
+    """
+    return ValidadorRUT._algoritmo_modulo11(numero_str)
+
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _mod11_kernel(buffer: bytes) -> int:  # pragma: no cover
+        """Núcleo compilado del módulo 11: retorna 11 - (suma % 11)."""
+        suma = 0
+        peso = 2
+        for i in range(len(buffer) - 1, -1, -1):
+            suma += (buffer[i] - 48) * peso
+            peso = 2 if peso == 7 else peso + 1
+        return 11 - suma % 11
+
+    @_njit(cache=True)
+    def _mod11_int_kernel(n: int) -> int:  # pragma: no cover
+        """Núcleo compilado del módulo 11 que opera sobre el int directo.
+
+        Extrae los dígitos con divisiones sucesivas, sin pasar por str
+        ni bytes; el número de un RUT cabe holgadamente en 64 bits.
+        """
+        total = 0
+        peso = 2
+        while n > 0:
+            total += (n % 10) * peso
+            n //= 10
+            peso = 2 if peso == 7 else peso + 1
+        return 11 - total % 11
+else:
+    _mod11_kernel = None
+    _mod11_int_kernel = None
+
+
+def _try_extraer_partes(rut) -> Optional[tuple]:
+    """Intenta extraer (numero_str, digito_verificador) sin lanzar excepciones.
+
+    Camino rápido para los flujos internos donde un RUT malformado es
+    un caso esperado (validar, validar_lista): retornar None evita el
+    costo de construir y desenrollar una excepción por cada entrada
+    inválida. Definida a nivel de módulo para que las llamadas internas
+    no paguen el despacho del descriptor de la clase.
+
+    Args:
+        rut: El RUT en cualquier formato (puede ser None o basura).
+
+    Returns:
+        Una tupla (numero_str, digito_verificador), o None si el RUT
+        no tiene un formato válido.
+    """
+    # Chequeos más baratos primero: None y string vacío salen sin
+    # tocar la tabla de traducción
+    if not rut:
+        return None
+
+    if not isinstance(rut, str):
+        rut = str(rut)
+
+    # Mismo filtro previo por mapa de bits que validar: además de
+    # descartar basura barato, garantiza que ambos puntos de entrada
+    # acepten exactamente el mismo conjunto de caracteres
+    if not _es_entrada_plausible(rut):
+        return None
+
+    rut_limpio = rut.translate(_TRANS_TABLE).strip()
+
+    # Formato básico: 7-8 dígitos más dígito verificador. El chequeo
+    # isascii es necesario porque isdigit también acepta dígitos Unicode
+    # ('²', '①', ...) que int() y los núcleos a nivel de byte rechazan
+    if not (8 <= len(rut_limpio) <= 9
+            and rut_limpio.isascii()
+            and rut_limpio[:-1].isdigit()
+            and rut_limpio[-1] in _DV_VALIDOS):
+        return None
+
+    return rut_limpio[:-1], rut_limpio[-1]
+
+
+def _formatear_from_parts(numero_str: str, digito: str,
+                          con_puntos: bool = True) -> str:
+    """Formatea un RUT a partir de sus partes ya extraídas.
+
+    Evita re-parsear cuando el llamador ya tiene el número y el
+    dígito verificador separados (como validar_lista tras validar).
+
+    Args:
+        numero_str: El número base como string de dígitos.
+        digito: El dígito verificador ('0'-'9' o 'K').
+        con_puntos: Si es True, incluye puntos de miles.
+
+    Returns:
+        El RUT formateado correctamente.
+    """
+    if not con_puntos:
+        return f"{numero_str}-{digito}"
+
+    # Agrupado de miles por slicing puro (memcpy a nivel C): evita
+    # el parseo a int y preserva eventuales ceros a la izquierda
+    n = len(numero_str)
+    if n <= 3:
+        cabeza = numero_str
+    elif n <= 6:
+        cabeza = f"{numero_str[:-3]}.{numero_str[-3:]}"
+    elif n <= 9:
+        cabeza = f"{numero_str[:-6]}.{numero_str[-6:-3]}.{numero_str[-3:]}"
+    else:
+        cabeza = (f"{numero_str[:-9]}.{numero_str[-9:-6]}"
+                  f".{numero_str[-6:-3]}.{numero_str[-3:]}")
+    return f"{cabeza}-{digito}"
+
+
+def _dv_int(numero: int) -> str:
+    """Calcula el dígito verificador para un int ya validado.
+
+    Camino rápido interno: omite el isinstance y la coerción
+    defensiva de calcular_digito_verificador(). El llamador debe
+    garantizar que numero es un entero positivo.
+
+    Args:
+        numero: El número base del RUT como entero positivo.
+
+    Returns:
+        El dígito verificador calculado ('0'-'9' o 'K').
+    """
+    if _mod11_int_c is not None:
+        # Extensión Cython: bucle en C sin conversión a str
+        return _DV_LOOKUP[_mod11_int_c(numero)]
+    if _mod11_int_kernel is not None:
+        # Con Numba disponible también se evita la conversión a str
+        return _DV_LOOKUP[_mod11_int_kernel(numero)]
+    if numero < 10_000_000_000:
+        # Python puro: bucle desenrollado, sin conversión a str
+        return _dv_unrolled(numero)
+    return _dv_str_cached(str(numero))
+
+
+def _validar_lista_serial(ruts: list, verificar_rango: bool = False) -> list:
+    """Implementación serial de validar_lista sobre un trozo de la lista.
+
+    A nivel de módulo para poder enviarla a procesos trabajadores (las
+    funciones planas se picklean; los métodos de clase no). Ver
+    ValidadorRUT.validar_lista para el contrato completo.
+    """
+    # Enlazar helpers y constantes a locales fuera de los bucles:
+    # evita la búsqueda por nombre global por elemento
+    try_extraer = _try_extraer_partes
+    dv_cached = _dv_str_cached
+    formatear_partes = _formatear_from_parts
+    rut_minimo = _RUT_MINIMO
+    rut_maximo = _RUT_MAXIMO
+
+    # Pasada 1: limpiar y parsear todas las entradas (trabajo de
+    # strings, tipo-uniforme)
+    partes_lista = [try_extraer(rut) for rut in ruts]
+
+    # Pasada 2: calcular todos los dígitos verificadores esperados
+    # (trabajo aritmético puro, aprovecha la caché)
+    dv_esperados = [
+        dv_cached(partes[0]) if partes is not None else None
+        for partes in partes_lista
+    ]
+
+    # Pasada 3: materializar los diccionarios de resultado
+    resultados = []
+    for rut, partes, dv_esperado in zip(ruts, partes_lista, dv_esperados):
+        resultado = {
+            'rut_original': rut,
+            'rut_formateado': None,
+            'es_valido': False,
+            'error': None
+        }
+
+        if partes is None:
+            resultado['error'] = (
+                "Formato de RUT inválido. "
+                "Debe tener 7-8 dígitos más dígito verificador"
+            )
+        else:
+            numero_str, digito_proporcionado = partes
+
+            if verificar_rango and not (
+                    rut_minimo <= int(numero_str) <= rut_maximo):
+                resultado['error'] = (
+                    "RUT fuera del rango típico "
+                    f"({rut_minimo:,} - {rut_maximo:,})"
+                )
+            elif digito_proporcionado == dv_esperado:
+                resultado['es_valido'] = True
+                # Reusar las partes ya extraídas: formatear(rut)
+                # volvería a limpiar y parsear el mismo string
+                resultado['rut_formateado'] = formatear_partes(
+                    numero_str, digito_proporcionado
+                )
+            else:
+                resultado['error'] = (
+                    f"Dígito verificador incorrecto. "
+                    f"Esperado: '{dv_esperado}', "
+                    f"Proporcionado: '{digito_proporcionado}'"
+                )
+
+        resultados.append(resultado)
+
+    return resultados
+
 
 class RUTInvalidoError(Exception):
     """Excepción lanzada cuando un RUT es inválido o tiene formato incorrecto.
@@ -22,16 +443,29 @@ class RUTInvalidoError(Exception):
         rut: El RUT que causó el error (si está disponible).
     """
     
+    __slots__ = ('mensaje', 'rut')
+
     def __init__(self, mensaje: str, rut: Optional[str] = None):
         """Inicializa la excepción con un mensaje y opcionalmente el RUT inválido.
-        
+
         Args:
             mensaje: Descripción del error.
             rut: El RUT que causó el error.
         """
         self.mensaje = mensaje
         self.rut = rut
-        super().__init__(f"{mensaje}" + (f" RUT: '{rut}'" if rut else ""))
+        # Pasar los atributos a args mantiene la excepción serializable
+        # (pickle/copy la reconstruyen desde args), necesario para que
+        # cruce procesos en validar_lista con workers
+        super().__init__(mensaje, rut)
+
+    def __str__(self) -> str:
+        # El mensaje formateado se construye solo si alguien lo pide:
+        # en lotes con datos sucios la mayoría de estas excepciones se
+        # captura y descarta sin llegar a formatearse
+        if self.rut:
+            return f"{self.mensaje} RUT: '{self.rut}'"
+        return self.mensaje
 
 
 class ValidadorRUT:
@@ -56,13 +490,14 @@ class ValidadorRUT:
         '12.345.678-5'
     """
     
+    # La clase es una API estática (solo classmethods, nunca se
+    # instancia): sin __dict__ por instancia
+    __slots__ = ()
+
     # Rango aproximado de RUTs válidos en Chile
-    RUT_MINIMO: int = 1_000_000
-    RUT_MAXIMO: int = 99_999_999
-    
-    # Patrón para validar formato básico (después de limpiar)
-    _PATRON_RUT_LIMPIO = re.compile(r'^(\d{7,8})([0-9Kk])$')
-    
+    RUT_MINIMO: int = _RUT_MINIMO
+    RUT_MAXIMO: int = _RUT_MAXIMO
+
     @staticmethod
     def _normalizar_rut(rut: str) -> str:
         """Normaliza un RUT eliminando caracteres no válidos y convirtiendo a mayúsculas.
@@ -83,8 +518,9 @@ class ValidadorRUT:
         if rut is None or (isinstance(rut, str) and rut.strip() == ""):
             raise RUTInvalidoError("El RUT no puede estar vacío o ser nulo", rut)
         
-        # Eliminar puntos, guiones, espacios y convertir a mayúsculas
-        rut_limpio = re.sub(r'[\.\-\s]', '', str(rut).upper().strip())
+        # Eliminar puntos, guiones y espacios, y normalizar 'k' a 'K',
+        # todo en una sola pasada con str.translate
+        rut_limpio = str(rut).translate(_TRANS_TABLE).strip()
         
         if not rut_limpio:
             raise RUTInvalidoError("El RUT no puede estar vacío después de limpiar", rut)
@@ -103,39 +539,56 @@ class ValidadorRUT:
         4. Se resta el resto de 11 para obtener el dígito verificador.
         5. Si el resultado es 11, el dígito es '0'.
         6. Si el resultado es 10, el dígito es 'K'.
-        
+
+        Nota de implementación: los multiplicadores están precalculados
+        por largo (sin ramas ni ciclo por dígito) y la reducción módulo
+        11 se hace una sola vez sobre la suma total, no por iteración;
+        la suma de un RUT de 8 dígitos cabe holgadamente en un int.
+
         Args:
-            numero: El número base del RUT como string (sin dígito verificador).
-            
+            numero: El número base del RUT (sin dígito verificador), como
+                   string de dígitos o bytes ASCII.
+
         Returns:
             El dígito verificador calculado ('0'-'9' o 'K').
-            
+
         Example:
             >>> ValidadorRUT._algoritmo_modulo11("12345678")
             '5'
         """
-        # Serie de multiplicadores (se repite cíclicamente)
-        multiplicadores = [2, 3, 4, 5, 6, 7]
-        
-        # Sumar productos de cada dígito por su multiplicador correspondiente
-        suma = 0
-        numero_invertido = numero[::-1]  # Invertir para procesar de derecha a izquierda
-        
-        for i, digito in enumerate(numero_invertido):
-            multiplicador = multiplicadores[i % len(multiplicadores)]
-            suma += int(digito) * multiplicador
-        
-        # Calcular el resto y el dígito verificador
-        resto = suma % 11
-        digito_verificador = 11 - resto
-        
-        # Casos especiales
-        if digito_verificador == 11:
-            return '0'
-        elif digito_verificador == 10:
-            return 'K'
-        else:
-            return str(digito_verificador)
+        # Convertir a bytes una sola vez: indexar bytes entrega ints
+        # directamente (sin el costo Unicode de iterar un str) y todos
+        # los núcleos consumen el mismo buffer
+        buffer = numero if isinstance(numero, bytes) else numero.encode()
+
+        # Mapeo directo por tabla en todos los caminos: sin ramas ni
+        # str() en la línea más caliente de la librería. Los núcleos
+        # compilados retornan 11 - (suma % 11) (tabla _DV_LOOKUP); los
+        # caminos en Python puro indexan el resto directo (_DV_CHARS) y
+        # se ahorran la resta.
+        if _mod11_c is not None:
+            # Camino más rápido: extensión Cython compilada
+            return _DV_LOOKUP[_mod11_c(buffer)]
+        if _mod11_kernel is not None:
+            # Camino rápido: núcleo compilado con Numba
+            return _DV_LOOKUP[_mod11_kernel(buffer)]
+        if len(buffer) <= 8:
+            # Caso común (RUT real): suma SWAR sobre un entero de 64 bits
+            return _DV_CHARS[_mod11_swar(buffer)]
+
+        # Sumar productos de cada dígito por su multiplicador, usando
+        # los pesos pre-alineados según el largo del número: sin
+        # invertir el string y sin módulo por iteración. Cada
+        # elemento del buffer ya es un int ASCII; basta restar 48
+        # ('0') en lugar de llamar a int() por dígito.
+        pesos = _WEIGHTS_BY_LEN.get(len(buffer))
+        if pesos is None:
+            pesos = tuple(_CICLO[i % 6] for i in range(len(buffer)))[::-1]
+        suma = sum(
+            (digito - 48) * multiplicador
+            for digito, multiplicador in zip(buffer, pesos)
+        )
+        return _DV_CHARS[suma % 11]
     
     @classmethod
     def limpiar(cls, rut: str) -> str:
@@ -158,6 +611,42 @@ class ValidadorRUT:
         """
         return cls._normalizar_rut(rut)
     
+    # Alias estáticos de las funciones de módulo homónimas: mantienen la
+    # API interna de la clase, pero las llamadas internas usan las
+    # funciones directas sin pasar por el descriptor
+    _try_extraer_partes = staticmethod(_try_extraer_partes)
+    _formatear_from_parts = staticmethod(_formatear_from_parts)
+    _dv_int = staticmethod(_dv_int)
+
+    @classmethod
+    def _extraer_partes_raw(cls, rut: str) -> tuple:
+        """Extrae (numero_str, digito_verificador) sin construir diccionarios.
+
+        Variante que sí lanza excepciones, usada por la API pública
+        extraer_partes(). Internamente delega en _try_extraer_partes().
+
+        Args:
+            rut: El RUT en cualquier formato válido.
+
+        Returns:
+            Una tupla (numero_str, digito_verificador).
+
+        Raises:
+            RUTInvalidoError: Si el RUT tiene formato inválido.
+        """
+        partes = _try_extraer_partes(rut)
+        if partes is not None:
+            return partes
+
+        # Solo el camino de error paga una segunda pasada: reusar los
+        # mensajes específicos de _normalizar_rut para entradas vacías
+        # o nulas antes del error genérico de formato
+        cls._normalizar_rut(rut)
+        raise RUTInvalidoError(
+            "Formato de RUT inválido. Debe tener 7-8 dígitos más dígito verificador",
+            rut
+        )
+
     @classmethod
     def extraer_partes(cls, rut: str) -> dict:
         """Extrae el número base y el dígito verificador de un RUT.
@@ -180,24 +669,13 @@ class ValidadorRUT:
             {'numero': 12345678, 'numero_str': '12345678', 
              'digito_verificador': 'K', 'rut_completo': '12345678K'}
         """
-        rut_limpio = cls._normalizar_rut(rut)
-        
-        # Validar formato básico
-        match = cls._PATRON_RUT_LIMPIO.match(rut_limpio)
-        if not match:
-            raise RUTInvalidoError(
-                "Formato de RUT inválido. Debe tener 7-8 dígitos más dígito verificador",
-                rut
-            )
-        
-        numero_str = match.group(1)
-        digito_verificador = match.group(2).upper()
-        
+        numero_str, digito_verificador = cls._extraer_partes_raw(rut)
+
         return {
             'numero': int(numero_str),
             'numero_str': numero_str,
             'digito_verificador': digito_verificador,
-            'rut_completo': rut_limpio
+            'rut_completo': numero_str + digito_verificador
         }
     
     @classmethod
@@ -231,16 +709,36 @@ class ValidadorRUT:
         
         if numero <= 0:
             raise RUTInvalidoError("El número del RUT debe ser positivo", str(numero))
-        
-        return cls._algoritmo_modulo11(str(numero))
+
+        return _dv_str_cached(str(numero))
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Limpia la caché interna de dígitos verificadores.
+
+        Útil en procesos de larga vida (servidores) si se desea liberar
+        la memoria usada por la memoización.
+        """
+        _dv_str_cached.cache_clear()
     
     @classmethod
-    def validar(cls, rut: str, verificar_rango: bool = False) -> bool:
+    def validar(cls, rut: str, verificar_rango: bool = False,
+                _tabla=_TRANS_TABLE, _dv_validos=_DV_VALIDOS,
+                _pesos=_WEIGHTS_BY_LEN, _dv_chars=_DV_CHARS) -> bool:
         """Valida si un RUT chileno es válido.
         
         Verifica que el formato sea correcto y que el dígito verificador
         corresponda al número base según el algoritmo módulo 11.
-        
+
+        El número se mantiene como string durante toda la validación: la
+        conversión a int (un parseo O(n) con asignación) solo ocurre si
+        se pide verificar_rango, único caso que necesita comparar valores
+        numéricos.
+
+        Los parámetros con guión bajo son un detalle de implementación:
+        ligan constantes del módulo como locales de la función (acceso
+        LOAD_FAST en vez de LOAD_GLOBAL) y no deben pasarse al llamar.
+
         Args:
             rut: El RUT a validar en cualquier formato aceptado.
             verificar_rango: Si es True, también verifica que el número
@@ -260,25 +758,56 @@ class ValidadorRUT:
             >>> ValidadorRUT.validar("12.345.678-0")  # Dígito incorrecto
             False
         """
-        try:
-            partes = cls.extraer_partes(rut)
-            numero_str = partes['numero_str']
-            digito_proporcionado = partes['digito_verificador']
-            numero = partes['numero']
-            
-            # Verificar rango si se solicita
-            if verificar_rango:
-                if numero < cls.RUT_MINIMO or numero > cls.RUT_MAXIMO:
+        # Chequeos más baratos primero; ver _try_extraer_partes
+        if not rut:
+            return False
+
+        if not isinstance(rut, str):
+            rut = str(rut)
+
+        # Filtro previo por mapa de bits: descartar basura cuesta ~un
+        # tercio de la limpieza completa, y las entradas válidas solo
+        # pagan una pasada C adicional sobre ~12 bytes
+        if not _es_entrada_plausible(rut):
+            return False
+
+        rut_limpio = rut.translate(_tabla).strip()
+
+        if not (8 <= len(rut_limpio) <= 9 and rut_limpio[-1] in _dv_validos):
+            return False
+
+        numero_str = rut_limpio[:-1]
+
+        if _mod11_c is not None or _mod11_kernel is not None:
+            # Con núcleo compilado conviene validar los dígitos aparte
+            # (isdigit es una pasada C) y delegar la suma al núcleo
+            if not numero_str.isdigit():
+                return False
+            digito_calculado = _dv_str_cached(numero_str)
+        else:
+            # Python puro: fusión de validación y suma en una sola
+            # pasada sobre los dígitos — cada byte se chequea como
+            # dígito y se acumula su producto en el mismo paso
+            suma = 0
+            for digito, peso in zip(numero_str.encode(),
+                                    _pesos[len(numero_str)]):
+                digito -= 48
+                if digito > 9 or digito < 0:
                     return False
-            
-            # Calcular dígito verificador esperado
-            digito_calculado = cls._algoritmo_modulo11(numero_str)
-            
-            # Comparar (case-insensitive ya que normalizamos a mayúsculas)
-            return digito_proporcionado == digito_calculado
-            
-        except RUTInvalidoError:
+                suma += digito * peso
+            digito_calculado = _dv_chars[suma % 11]
+
+        if rut_limpio[-1] != digito_calculado:
             return False
+
+        # Verificar rango si se solicita (único caso que requiere
+        # convertir el número a int)
+        if verificar_rango:
+            numero = int(numero_str)
+            if numero < _RUT_MINIMO or numero > _RUT_MAXIMO:
+                return False
+
+        return True
     
     @classmethod
     def formatear(cls, rut: str, con_puntos: bool = True) -> str:
@@ -302,29 +831,26 @@ class ValidadorRUT:
             >>> ValidadorRUT.formatear("123456785", con_puntos=False)
             '12345678-5'
         """
-        partes = cls.extraer_partes(rut)
-        numero_str = partes['numero_str']
-        digito = partes['digito_verificador']
-        
-        if con_puntos:
-            # Formatear con puntos de miles
-            numero_formateado = ""
-            for i, char in enumerate(reversed(numero_str)):
-                if i > 0 and i % 3 == 0:
-                    numero_formateado = "." + numero_formateado
-                numero_formateado = char + numero_formateado
-            return f"{numero_formateado}-{digito}"
-        else:
-            return f"{numero_str}-{digito}"
+        numero_str, digito = cls._extraer_partes_raw(rut)
+        return _formatear_from_parts(numero_str, digito, con_puntos)
     
     @classmethod
-    def validar_lista(cls, ruts: list, verificar_rango: bool = False) -> list:
+    def validar_lista(cls, ruts: list, verificar_rango: bool = False,
+                      workers: Optional[int] = None) -> list:
         """Valida una lista de RUTs y retorna resultados detallados.
-        
+
+        Para listas grandes (>= 10.000 elementos) el trabajo se reparte
+        entre procesos: cada RUT es independiente, por lo que la lista se
+        divide en trozos contiguos y los resultados se concatenan en el
+        orden original.
+
         Args:
             ruts: Lista de RUTs a validar (en cualquier formato).
             verificar_rango: Si es True, también verifica el rango de cada RUT.
-            
+            workers: Cantidad de procesos a usar para listas grandes.
+                    Por defecto usa todos los núcleos disponibles; con
+                    workers=1 se fuerza el camino serial.
+
         Returns:
             Lista de diccionarios, cada uno con:
                 - 'rut_original': El RUT tal como fue proporcionado.
@@ -341,42 +867,204 @@ class ValidadorRUT:
             >>> resultados[0]['es_valido']
             True
         """
+        # Lotes chicos (o una sola CPU): camino serial directo
+        if len(ruts) < 10_000 or workers == 1:
+            return _validar_lista_serial(ruts, verificar_rango)
+
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+            if workers == 1:
+                return _validar_lista_serial(ruts, verificar_rango)
+
+        # El trabajo es perfectamente paralelo: repartir en trozos
+        # contiguos y concatenar los resultados en orden
+        tamano = (len(ruts) + workers - 1) // workers
+        trozos = [ruts[i:i + tamano] for i in range(0, len(ruts), tamano)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partes = executor.map(
+                partial(_validar_lista_serial, verificar_rango=verificar_rango),
+                trozos
+            )
+
         resultados = []
-        
-        for rut in ruts:
-            resultado = {
-                'rut_original': rut,
-                'rut_formateado': None,
-                'es_valido': False,
-                'error': None
-            }
-            
-            try:
-                es_valido = cls.validar(rut, verificar_rango=verificar_rango)
-                resultado['es_valido'] = es_valido
-                
-                if es_valido:
-                    resultado['rut_formateado'] = cls.formatear(rut)
-                else:
-                    # Intentar dar más información sobre por qué es inválido
-                    try:
-                        partes = cls.extraer_partes(rut)
-                        digito_correcto = cls.calcular_digito_verificador(partes['numero'])
-                        resultado['error'] = (
-                            f"Dígito verificador incorrecto. "
-                            f"Esperado: '{digito_correcto}', "
-                            f"Proporcionado: '{partes['digito_verificador']}'"
-                        )
-                    except RUTInvalidoError as e:
-                        resultado['error'] = str(e)
-                        
-            except Exception as e:
-                resultado['error'] = str(e)
-            
-            resultados.append(resultado)
-        
+        for parte in partes:
+            resultados.extend(parte)
         return resultados
     
+    @classmethod
+    def validar_lista_soa(cls, ruts: list, verificar_rango: bool = False) -> dict:
+        """Valida una lista de RUTs y retorna los resultados por columnas (SoA).
+
+        Alternativa a validar_lista() para lotes grandes: en vez de un
+        diccionario por fila (una tabla hash y varios objetos por RUT),
+        retorna un diccionario de columnas paralelas, más liviano para el
+        recolector de basura y directamente enmascarable con NumPy.
+
+        Args:
+            ruts: Lista de RUTs a validar (en cualquier formato).
+            verificar_rango: Si es True, también verifica el rango de cada RUT.
+
+        Returns:
+            Un diccionario con las columnas:
+                - 'rut_original': Lista con los RUTs tal como fueron dados.
+                - 'rut_formateado': Lista con el RUT formateado o None.
+                - 'es_valido': Arreglo booleano de NumPy si está
+                  disponible, o lista de bool en caso contrario.
+                - 'error': Lista con el mensaje de error o None.
+
+        Example:
+            >>> columnas = ValidadorRUT.validar_lista_soa(["12.345.678-5"])
+            >>> columnas['es_valido'][0]
+            True
+        """
+        try_extraer = _try_extraer_partes
+        dv_cached = _dv_str_cached
+        rut_minimo, rut_maximo = _RUT_MINIMO, _RUT_MAXIMO
+
+        n = len(ruts)
+        es_valido = [False] * n
+        formateados = [None] * n
+        errores = [None] * n
+
+        partes_lista = [try_extraer(rut) for rut in ruts]
+
+        for i, partes in enumerate(partes_lista):
+            if partes is None:
+                errores[i] = (
+                    "Formato de RUT inválido. "
+                    "Debe tener 7-8 dígitos más dígito verificador"
+                )
+                continue
+
+            numero_str, digito_proporcionado = partes
+            digito_calculado = dv_cached(numero_str)
+
+            if verificar_rango and not (
+                    rut_minimo <= int(numero_str) <= rut_maximo):
+                errores[i] = (
+                    "RUT fuera del rango típico "
+                    f"({rut_minimo:,} - {rut_maximo:,})"
+                )
+            elif digito_proporcionado == digito_calculado:
+                es_valido[i] = True
+                formateados[i] = _formatear_from_parts(
+                    numero_str, digito_proporcionado
+                )
+            else:
+                errores[i] = (
+                    f"Dígito verificador incorrecto. "
+                    f"Esperado: '{digito_calculado}', "
+                    f"Proporcionado: '{digito_proporcionado}'"
+                )
+
+        if _np is not None:
+            es_valido = _np.asarray(es_valido, dtype=bool)
+
+        return {
+            'rut_original': list(ruts),
+            'rut_formateado': formateados,
+            'es_valido': es_valido,
+            'error': errores
+        }
+
+    @classmethod
+    def validar_batch(cls, ruts: list) -> list:
+        """Valida un lote de RUTs retornando solo booleanos.
+
+        Variante liviana de validar_lista() para el camino caliente de
+        servidores: no construye diccionarios de resultado ni mensajes de
+        error, y el cálculo del dígito verificador usa el núcleo más
+        rápido disponible (extensión Cython, Numba o Python puro). Para
+        lotes muy grandes con NumPy instalado, validar_lista_np puede
+        ser aún más rápido.
+
+        Args:
+            ruts: Lista de RUTs a validar (en cualquier formato).
+
+        Returns:
+            Lista de booleanos, uno por RUT, en el mismo orden.
+
+        Example:
+            >>> ValidadorRUT.validar_batch(["12.345.678-5", "invalido"])
+            [True, False]
+        """
+        # Enlazar a locales fuera del bucle: evita la búsqueda de
+        # atributo por iteración
+        try_extraer = _try_extraer_partes
+        dv_cached = _dv_str_cached
+
+        resultados = []
+        append = resultados.append
+        for rut in ruts:
+            partes = try_extraer(rut)
+            append(partes is not None and partes[1] == dv_cached(partes[0]))
+        return resultados
+
+    @classmethod
+    def validar_lista_np(cls, ruts: list) -> "_np.ndarray":
+        """Valida un lote de RUTs de forma vectorizada usando NumPy.
+
+        A diferencia de validar_lista(), esta variante calcula todos los
+        dígitos verificadores en una sola pasada vectorizada (estructura
+        SoA: matriz de dígitos + vector de DVs), evitando el costo por
+        elemento del intérprete. Recomendada para listas grandes.
+
+        Args:
+            ruts: Lista de RUTs a validar (en cualquier formato).
+
+        Returns:
+            Un arreglo booleano de NumPy donde cada posición indica si el
+            RUT correspondiente es válido.
+
+        Raises:
+            ImportError: Si NumPy no está instalado.
+
+        Example:
+            >>> ValidadorRUT.validar_lista_np(["12.345.678-5", "invalido"])
+            array([ True, False])
+        """
+        if _np is None:
+            raise ImportError(
+                "NumPy es requerido para validar_lista_np. "
+                "Instálelo con: pip install numpy"
+            )
+
+        n = len(ruts)
+        # Matriz de dígitos (N, 8) rellenada con ceros a la izquierda y
+        # vector de DVs proporcionados (0-9, 10 para 'K', 255 si no parsea)
+        digitos = _np.zeros((n, 8), dtype=_np.uint8)
+        dv_proporcionado = _np.full(n, 255, dtype=_np.uint8)
+
+        for i, rut in enumerate(ruts):
+            try:
+                rut_limpio = cls._normalizar_rut(rut)
+            except RUTInvalidoError:
+                continue
+            if not (8 <= len(rut_limpio) <= 9
+                    and rut_limpio.isascii()
+                    and rut_limpio[:-1].isdigit()
+                    and rut_limpio[-1] in _DV_VALIDOS):
+                continue
+            numero_str = rut_limpio[:-1]
+            digito = rut_limpio[-1]
+            buffer = numero_str.rjust(8, '0').encode()
+            digitos[i] = _np.frombuffer(buffer, dtype=_np.uint8) - 48
+            dv_proporcionado[i] = 10 if digito == 'K' else ord(digito) - 48
+
+        # Pesos alineados de izquierda a derecha para el ancho fijo de 8
+        # dígitos (el relleno con ceros no aporta a la suma)
+        pesos = _np.array([3, 2, 7, 6, 5, 4, 3, 2], dtype=_np.uint16)
+        sumas = (digitos.astype(_np.uint16) * pesos).sum(axis=1)
+        # 0-9 son dígitos, 10 representa 'K' (el caso 11 se pliega a 0)
+        dv_calculado = (11 - sumas % 11) % 11
+
+        return dv_calculado == dv_proporcionado
+
     @classmethod
     def generar_rut_aleatorio(cls, minimo: int = 10_000_000, maximo: int = 25_000_000) -> str:
         """Genera un RUT válido aleatorio para pruebas.
@@ -399,9 +1087,66 @@ class ValidadorRUT:
         """
         import random
         numero = random.randint(minimo, maximo)
-        digito = cls.calcular_digito_verificador(numero)
-        return cls.formatear(f"{numero}{digito}")
+        digito = _dv_int(numero)
+        # Construir el string directamente: pasar por formatear()
+        # volvería a limpiar y parsear un número que ya tenemos como int
+        return f"{numero:,}".replace(',', '.') + f"-{digito}"
     
+    @classmethod
+    def generar_ruts_aleatorios(cls, n: int,
+                                minimo: int = 10_000_000,
+                                maximo: int = 25_000_000) -> list:
+        """Genera múltiples RUTs válidos aleatorios en una pasada vectorizada.
+
+        Contraparte por lotes de generar_rut_aleatorio(): sortea los n
+        números con una sola llamada a NumPy y calcula todos los dígitos
+        verificadores de forma vectorizada, en lugar de una llamada
+        Python por RUT.
+
+        ADVERTENCIA: Este método es solo para pruebas y desarrollo.
+
+        Args:
+            n: Cantidad de RUTs a generar.
+            minimo: Número mínimo del RUT a generar.
+            maximo: Número máximo del RUT a generar.
+
+        Returns:
+            Lista de n RUTs válidos formateados con puntos y guión.
+
+        Raises:
+            ImportError: Si NumPy no está instalado.
+
+        Example:
+            >>> ruts = ValidadorRUT.generar_ruts_aleatorios(1000)
+            >>> all(ValidadorRUT.validar(rut) for rut in ruts)
+            True
+        """
+        if _np is None:
+            raise ImportError(
+                "NumPy es requerido para generar_ruts_aleatorios. "
+                "Instálelo con: pip install numpy"
+            )
+
+        numeros = _obtener_np_rng().integers(
+            minimo, maximo + 1, size=n, dtype=_np.int64
+        )
+
+        # Matriz de dígitos (N, 8) de izquierda a derecha; los ceros a la
+        # izquierda de números cortos no aportan a la suma
+        potencias = 10 ** _np.arange(7, -1, -1, dtype=_np.int64)
+        digitos = (numeros[:, None] // potencias) % 10
+
+        # Pesos alineados de izquierda a derecha para el ancho fijo de 8
+        pesos = _np.array([3, 2, 7, 6, 5, 4, 3, 2], dtype=_np.int64)
+        dv_indices = (11 - (digitos * pesos).sum(axis=1) % 11) % 11
+        tabla_dv = _np.array(list('0123456789K'))
+        dvs = tabla_dv[dv_indices]
+
+        return [
+            f"{int(numero):,}".replace(',', '.') + f"-{dv}"
+            for numero, dv in zip(numeros, dvs)
+        ]
+
     @classmethod
     def es_rut_empresa(cls, rut: str) -> bool:
         """Determina si un RUT corresponde probablemente a una empresa.
@@ -425,9 +1170,9 @@ class ValidadorRUT:
             >>> ValidadorRUT.es_rut_empresa("12.345.678-5")
             False
         """
-        try:
-            partes = cls.extraer_partes(rut)
-            # RUTs de empresas típicamente empiezan con 50+ millones
-            return partes['numero'] >= 50_000_000
-        except RUTInvalidoError:
+        partes = _try_extraer_partes(rut)
+        if partes is None:
             return False
+
+        # RUTs de empresas típicamente empiezan con 50+ millones
+        return int(partes[0]) >= 50_000_000
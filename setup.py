@@ -1,6 +1,17 @@
 """Setup script para PyRUT."""
 
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+
+# La extensión Cython es opcional: acelera el núcleo módulo 11, pero el
+# paquete funciona igual en Python puro si Cython no está disponible.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("pyrut._core", ["pyrut/_core.pyx"])],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -15,6 +26,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/pyrut/pyrut",
     packages=find_packages(exclude=["tests", "examples"]),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -7,6 +7,14 @@ Ejecutar con: pytest tests/test_validador.py -v
 import pytest
 from pyrut import ValidadorRUT, RUTInvalidoError
 
+# NumPy es una dependencia opcional: algunos tests cubren las rutas
+# vectorizadas (requieren NumPy) y otros la rama de error cuando falta
+try:
+    import numpy
+    TIENE_NUMPY = True
+except ImportError:
+    TIENE_NUMPY = False
+
 
 class TestValidarRUT:
     """Tests para el método validar()."""
@@ -217,9 +225,134 @@ class TestValidarLista:
         """Verifica que los válidos incluyan formato correcto."""
         ruts = ["123456785"]
         resultados = ValidadorRUT.validar_lista(ruts)
-        
+
         assert resultados[0]['rut_formateado'] == "12.345.678-5"
 
+    def test_validar_lista_rango_fuera(self):
+        """Reporta error de rango con verificar_rango=True."""
+        digito = ValidadorRUT.calcular_digito_verificador(100)
+        resultados = ValidadorRUT.validar_lista(
+            [f"0000100-{digito}"], verificar_rango=True
+        )
+
+        assert resultados[0]['es_valido'] is False
+        assert "fuera del rango" in resultados[0]['error']
+
+    def test_validar_lista_workers_equivalentes(self):
+        """El camino paralelo produce lo mismo que el serial, en orden."""
+        # Más de 10.000 elementos para activar el reparto en procesos
+        ruts = ["12.345.678-5", "12.345.678-0", "invalido"] * 3400
+        serial = ValidadorRUT.validar_lista(ruts, workers=1)
+        paralelo = ValidadorRUT.validar_lista(ruts, workers=2)
+
+        assert paralelo == serial
+
+
+class TestValidarListaSoa:
+    """Tests para el método validar_lista_soa()."""
+
+    def test_soa_columnas_paralelas(self):
+        """Retorna columnas paralelas del mismo largo que la entrada."""
+        ruts = ["12.345.678-5", "12.345.678-0", "invalido"]
+        columnas = ValidadorRUT.validar_lista_soa(ruts)
+
+        assert set(columnas) == {
+            'rut_original', 'rut_formateado', 'es_valido', 'error'
+        }
+        assert len(columnas['es_valido']) == 3
+        assert columnas['rut_original'] == ruts
+
+    def test_soa_coincide_con_validar_lista(self):
+        """Las columnas coinciden fila a fila con validar_lista()."""
+        # 9.007.895-k es un RUT válido con dígito K (en minúscula)
+        ruts = ["12.345.678-5", "12.345.678-0", "invalido", "9.007.895-k"]
+        filas = ValidadorRUT.validar_lista(ruts)
+        columnas = ValidadorRUT.validar_lista_soa(ruts)
+
+        for i, fila in enumerate(filas):
+            assert bool(columnas['es_valido'][i]) == fila['es_valido']
+            assert columnas['rut_formateado'][i] == fila['rut_formateado']
+            assert columnas['error'][i] == fila['error']
+
+    def test_soa_rango_fuera(self):
+        """Reporta error de rango con verificar_rango=True."""
+        digito = ValidadorRUT.calcular_digito_verificador(100)
+        columnas = ValidadorRUT.validar_lista_soa(
+            [f"0000100-{digito}"], verificar_rango=True
+        )
+
+        assert bool(columnas['es_valido'][0]) is False
+        assert "fuera del rango" in columnas['error'][0]
+
+    @pytest.mark.skipif(not TIENE_NUMPY, reason="requiere NumPy")
+    def test_soa_es_valido_como_arreglo_numpy(self):
+        """Con NumPy disponible, es_valido es un arreglo booleano."""
+        columnas = ValidadorRUT.validar_lista_soa(["12.345.678-5"])
+        assert isinstance(columnas['es_valido'], numpy.ndarray)
+
+
+class TestValidarBatch:
+    """Tests para el método validar_batch()."""
+
+    def test_batch_mixto(self):
+        """Retorna un booleano por RUT, en orden."""
+        ruts = ["12.345.678-5", "12.345.678-0", "invalido"]
+        assert ValidadorRUT.validar_batch(ruts) == [True, False, False]
+
+    def test_batch_vacio(self):
+        """Retorna lista vacía para entrada vacía."""
+        assert ValidadorRUT.validar_batch([]) == []
+
+    def test_batch_coincide_con_validar(self):
+        """Coincide con validar() para distintos formatos."""
+        ruts = ["12.345.678-5", "12345678-5", "123456785",
+                "9.007.895-k", "", None, "ABC12345-5"]
+        esperados = [ValidadorRUT.validar(rut) for rut in ruts]
+        assert ValidadorRUT.validar_batch(ruts) == esperados
+
+
+class TestValidarListaNp:
+    """Tests para el método validar_lista_np()."""
+
+    @pytest.mark.skipif(not TIENE_NUMPY, reason="requiere NumPy")
+    def test_np_mixto(self):
+        """Retorna un arreglo booleano por RUT, en orden."""
+        # El último RUT se construye con su DV real para no depender de
+        # un valor esperado escrito a mano
+        digito = ValidadorRUT.calcular_digito_verificador(9007895)
+        ruts = ["12.345.678-5", "12.345.678-0", "invalido",
+                f"9.007.895-{digito.lower()}"]
+        resultado = ValidadorRUT.validar_lista_np(ruts)
+
+        assert isinstance(resultado, numpy.ndarray)
+        assert list(resultado) == [True, False, False, True]
+
+    @pytest.mark.skipif(not TIENE_NUMPY, reason="requiere NumPy")
+    def test_np_coincide_con_validar(self):
+        """Coincide con validar() para distintos formatos."""
+        ruts = ["12.345.678-5", "12345678-5", "123456785",
+                "11.111.111-1", "1234567²5", "invalido"]
+        esperados = [ValidadorRUT.validar(rut) for rut in ruts]
+        assert list(ValidadorRUT.validar_lista_np(ruts)) == esperados
+
+    @pytest.mark.skipif(TIENE_NUMPY, reason="cubre la rama sin NumPy")
+    def test_np_sin_numpy_error(self):
+        """Lanza ImportError si NumPy no está instalado."""
+        with pytest.raises(ImportError):
+            ValidadorRUT.validar_lista_np(["12.345.678-5"])
+
+
+class TestCacheClear:
+    """Tests para el método cache_clear()."""
+
+    def test_cache_clear_no_altera_resultados(self):
+        """Limpiar la caché no cambia los cálculos posteriores."""
+        antes = ValidadorRUT.calcular_digito_verificador(12345678)
+        ValidadorRUT.cache_clear()
+        despues = ValidadorRUT.calcular_digito_verificador(12345678)
+
+        assert antes == despues == "5"
+
 
 class TestGenerarRutAleatorio:
     """Tests para el método generar_rut_aleatorio()."""
@@ -243,6 +376,34 @@ class TestGenerarRutAleatorio:
             assert 10_000_000 <= partes['numero'] <= 11_000_000
 
 
+class TestGenerarRutsAleatorios:
+    """Tests para el método generar_ruts_aleatorios()."""
+
+    @pytest.mark.skipif(not TIENE_NUMPY, reason="requiere NumPy")
+    def test_generar_lote_valido(self):
+        """Genera n RUTs válidos y formateados."""
+        ruts = ValidadorRUT.generar_ruts_aleatorios(100)
+
+        assert len(ruts) == 100
+        assert all(ValidadorRUT.validar(rut) for rut in ruts)
+
+    @pytest.mark.skipif(not TIENE_NUMPY, reason="requiere NumPy")
+    def test_generar_lote_rango_especifico(self):
+        """Genera RUTs dentro de un rango específico."""
+        ruts = ValidadorRUT.generar_ruts_aleatorios(
+            50, minimo=10_000_000, maximo=11_000_000
+        )
+        for rut in ruts:
+            partes = ValidadorRUT.extraer_partes(rut)
+            assert 10_000_000 <= partes['numero'] <= 11_000_000
+
+    @pytest.mark.skipif(TIENE_NUMPY, reason="cubre la rama sin NumPy")
+    def test_generar_lote_sin_numpy_error(self):
+        """Lanza ImportError si NumPy no está instalado."""
+        with pytest.raises(ImportError):
+            ValidadorRUT.generar_ruts_aleatorios(10)
+
+
 class TestEsRutEmpresa:
     """Tests para el método es_rut_empresa()."""
     
@@ -292,6 +453,17 @@ class TestCasosLimite:
         """Maneja None como entrada."""
         assert ValidadorRUT.validar(None) is False
 
+    def test_rut_con_espacio_no_separable(self):
+        """Acepta el espacio no separable (U+00A0) como separador."""
+        # Frecuente en datos pegados desde páginas web
+        assert ValidadorRUT.validar("\u00a012.345.678-5\u00a0") is True
+        assert ValidadorRUT.limpiar("12.345.678\u00a0-5") == "123456785"
+
+    def test_rut_con_blancos_verticales(self):
+        """Acepta tabulación vertical y salto de página como blancos."""
+        assert ValidadorRUT.validar("12.345.678-5\x0b") is True
+        assert ValidadorRUT.validar("12.345.678\x0c-5") is True
+
 
 class TestRUTInvalidoError:
     """Tests para la excepción RUTInvalidoError."""